@@ -7,15 +7,202 @@ import os
 import pathlib
 import re
 import threading
+import time
 
 from overrides import override
 
+from solidlsp import ls_types
 from solidlsp.ls import SolidLanguageServer
 from solidlsp.ls_config import LanguageServerConfig
 from solidlsp.ls_logger import LanguageServerLogger
-from solidlsp.lsp_protocol_handler.lsp_types import InitializeParams
+from solidlsp.lsp_protocol_handler import lsp_types
+from solidlsp.lsp_protocol_handler.lsp_types import DefinitionParams, InitializeParams
 from solidlsp.lsp_protocol_handler.server import ProcessLaunchInfo
 
+_IGNORED_DIRNAMES = frozenset({".build", ".swiftpm", "build", "DerivedData", ".DS_Store", "xcuserdata"})
+# Xcode bundle directories, e.g. MyApp.xcodeproj
+_IGNORED_DIRNAME_SUFFIXES = (".xcworkspace", ".xcodeproj")
+
+# The static parts of the initialize request are built once at import time and shared between server starts;
+# only the workspace-specific values are filled in by SwiftLanguageServer._get_initialize_params.
+_SYMBOL_KIND_VALUES = tuple(range(1, 27))
+_COMPLETION_ITEM_KIND_VALUES = tuple(range(1, 26))
+
+_BASE_INIT_OPTIONS = {
+    # SourceKit-LSP specific configuration
+    "fallbackBuildSystem": "swiftpm",
+    "backgroundIndexing": True,
+    "completion": {"maxResults": 200, "serverSideFiltering": True},
+}
+
+_BASE_CAPABILITIES = {
+    "workspace": {
+        "applyEdit": True,
+        "workspaceEdit": {"documentChanges": True},
+        "didChangeConfiguration": {"dynamicRegistration": True},
+        "didChangeWatchedFiles": {"dynamicRegistration": True},
+        "symbol": {
+            "dynamicRegistration": True,
+            "symbolKind": {"valueSet": _SYMBOL_KIND_VALUES},
+        },
+        "executeCommand": {"dynamicRegistration": True},
+        "workspaceFolders": True,
+        "configuration": True,
+    },
+    "textDocument": {
+        "synchronization": {"dynamicRegistration": True, "willSave": True, "willSaveWaitUntil": True, "didSave": True},
+        "completion": {
+            "dynamicRegistration": True,
+            "contextSupport": True,
+            "completionItem": {
+                "snippetSupport": True,
+                "commitCharactersSupport": True,
+                "documentationFormat": ["markdown", "plaintext"],
+                "deprecatedSupport": True,
+                "preselectSupport": True,
+                "tagSupport": {"valueSet": [1, 2]},
+                "insertReplaceSupport": True,
+                "resolveSupport": {"properties": ["documentation", "detail", "additionalTextEdits"]},
+            },
+            "completionItemKind": {"valueSet": _COMPLETION_ITEM_KIND_VALUES},
+            "insertTextMode": 2,
+        },
+        "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},
+        "signatureHelp": {
+            "dynamicRegistration": True,
+            "signatureInformation": {
+                "documentationFormat": ["markdown", "plaintext"],
+                "parameterInformation": {"labelOffsetSupport": True},
+                "activeParameterSupport": True,
+            },
+            "contextSupport": True,
+        },
+        "definition": {"dynamicRegistration": True, "linkSupport": True},
+        "references": {"dynamicRegistration": True},
+        "documentHighlight": {"dynamicRegistration": True},
+        "documentSymbol": {
+            "dynamicRegistration": True,
+            "symbolKind": {"valueSet": _SYMBOL_KIND_VALUES},
+            "hierarchicalDocumentSymbolSupport": True,
+            "tagSupport": {"valueSet": [1, 2]},
+        },
+        "codeAction": {
+            "dynamicRegistration": True,
+            "isPreferredSupport": True,
+            "disabledSupport": True,
+            "dataSupport": True,
+            "codeActionLiteralSupport": {
+                "codeActionKind": {
+                    "valueSet": [
+                        "",
+                        "quickfix",
+                        "refactor",
+                        "refactor.extract",
+                        "refactor.inline",
+                        "refactor.rewrite",
+                        "source",
+                        "source.organizeImports",
+                        "source.fixAll",
+                    ]
+                }
+            },
+            "resolveSupport": {"properties": ["edit"]},
+        },
+        "codeLens": {"dynamicRegistration": True},
+        "formatting": {"dynamicRegistration": True},
+        "rangeFormatting": {"dynamicRegistration": True},
+        "onTypeFormatting": {"dynamicRegistration": True},
+        "rename": {"dynamicRegistration": True, "prepareSupport": True},
+        "foldingRange": {
+            "dynamicRegistration": True,
+            "rangeLimit": 5000,
+            "lineFoldingOnly": True,
+        },
+        "selectionRange": {"dynamicRegistration": True},
+        "publishDiagnostics": {
+            "relatedInformation": True,
+            "versionSupport": False,
+            "tagSupport": {"valueSet": [1, 2]},
+            "codeDescriptionSupport": True,
+            "dataSupport": True,
+        },
+        "callHierarchy": {"dynamicRegistration": True},
+        "semanticTokens": {
+            "dynamicRegistration": True,
+            "tokenTypes": [
+                "namespace",
+                "type",
+                "class",
+                "enum",
+                "interface",
+                "struct",
+                "typeParameter",
+                "parameter",
+                "variable",
+                "property",
+                "enumMember",
+                "event",
+                "function",
+                "method",
+                "macro",
+                "keyword",
+                "modifier",
+                "comment",
+                "string",
+                "number",
+                "regexp",
+                "operator",
+            ],
+            "tokenModifiers": [
+                "declaration",
+                "definition",
+                "readonly",
+                "static",
+                "deprecated",
+                "abstract",
+                "async",
+                "modification",
+                "documentation",
+                "defaultLibrary",
+            ],
+            "formats": ["relative"],
+            "requests": {"range": True, "full": {"delta": True}},
+        },
+    },
+    "window": {
+        "workDoneProgress": True,
+        "showMessage": {"messageActionItem": {"additionalPropertiesSupport": True}},
+        "showDocument": {"support": True},
+    },
+    "general": {
+        "regularExpressions": {"engine": "ECMAScript"},
+        "markdown": {"parser": "marked", "version": "1.1.0"},
+    },
+}
+
+# Messages from SourceKit-LSP which indicate that the initial workspace analysis is complete.
+# Each pattern is matched in a single case-insensitive pass over the raw message; a case-sensitive substring
+# prefilter (e.g. `"build" in message`) is deliberately not used, since it would reject messages such as "Build succeeded".
+_LOG_DONE_RE = re.compile(r"indexing complete|finished indexing|build complete|compilation finished|swift package resolved", re.IGNORECASE)
+_SHOW_DONE_RE = re.compile(r"package resolution complete|build succeeded|indexing finished", re.IGNORECASE)
+_PROGRESS_DONE_RE = re.compile(r"indexing|building|resolving", re.IGNORECASE)
+
+
+def _do_nothing(params):
+    return
+
+
+def _empty_client_command(params):
+    return []
+
+
+def _workspace_configuration(params):
+    """
+    Handle workspace/configuration requests from SourceKit-LSP
+    """
+    # Return empty configuration for now (one distinct dict per requested item)
+    return [{} for _ in params.get("items", ())]
+
 
 class SwiftLanguageServer(SolidLanguageServer):
     """
@@ -40,286 +227,159 @@ class SwiftLanguageServer(SolidLanguageServer):
         # Event to signal when initial workspace analysis is complete
         self.analysis_complete = threading.Event()
         self.found_source_files = False
+        # Maximum time (counted from the initialization handshake) for which index-backed requests wait
+        # for the initial workspace analysis
+        self.analysis_timeout = 15.0
+        # Monotonic time after which requests no longer wait for the analysis; set in _start_server
+        self._analysis_deadline = 0.0
 
     @override
     def is_ignored_dirname(self, dirname: str) -> bool:
-        return super().is_ignored_dirname(dirname) or dirname in [
-            ".build",
-            ".swiftpm",
-            "build",
-            "DerivedData",
-            ".DS_Store",
-            "xcuserdata",
-            "*.xcworkspace",
-            "*.xcodeproj",
-        ]
+        return super().is_ignored_dirname(dirname) or dirname in _IGNORED_DIRNAMES or dirname.endswith(_IGNORED_DIRNAME_SUFFIXES)
 
     def _get_initialize_params(self, repository_absolute_path: str) -> InitializeParams:
         """
         Returns the initialize params for the SourceKit-LSP Language Server.
         """
-        # Create basic initialization parameters
+        root_uri = pathlib.Path(repository_absolute_path).as_uri()
         initialize_params: InitializeParams = {  # type: ignore
             "processId": os.getpid(),
             "rootPath": repository_absolute_path,
-            "rootUri": pathlib.Path(repository_absolute_path).as_uri(),
-            "initializationOptions": {
-                # SourceKit-LSP specific configuration
-                "fallbackBuildSystem": "swiftpm",
-                "backgroundIndexing": True,
-                "completion": {"maxResults": 200, "serverSideFiltering": True},
-            },
-            "capabilities": {
-                "workspace": {
-                    "applyEdit": True,
-                    "workspaceEdit": {"documentChanges": True},
-                    "didChangeConfiguration": {"dynamicRegistration": True},
-                    "didChangeWatchedFiles": {"dynamicRegistration": True},
-                    "symbol": {
-                        "dynamicRegistration": True,
-                        "symbolKind": {
-                            "valueSet": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26]
-                        },
-                    },
-                    "executeCommand": {"dynamicRegistration": True},
-                    "workspaceFolders": True,
-                    "configuration": True,
-                },
-                "textDocument": {
-                    "synchronization": {"dynamicRegistration": True, "willSave": True, "willSaveWaitUntil": True, "didSave": True},
-                    "completion": {
-                        "dynamicRegistration": True,
-                        "contextSupport": True,
-                        "completionItem": {
-                            "snippetSupport": True,
-                            "commitCharactersSupport": True,
-                            "documentationFormat": ["markdown", "plaintext"],
-                            "deprecatedSupport": True,
-                            "preselectSupport": True,
-                            "tagSupport": {"valueSet": [1, 2]},
-                            "insertReplaceSupport": True,
-                            "resolveSupport": {"properties": ["documentation", "detail", "additionalTextEdits"]},
-                        },
-                        "completionItemKind": {
-                            "valueSet": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25]
-                        },
-                        "insertTextMode": 2,
-                    },
-                    "hover": {"dynamicRegistration": True, "contentFormat": ["markdown", "plaintext"]},
-                    "signatureHelp": {
-                        "dynamicRegistration": True,
-                        "signatureInformation": {
-                            "documentationFormat": ["markdown", "plaintext"],
-                            "parameterInformation": {"labelOffsetSupport": True},
-                            "activeParameterSupport": True,
-                        },
-                        "contextSupport": True,
-                    },
-                    "definition": {"dynamicRegistration": True, "linkSupport": True},
-                    "references": {"dynamicRegistration": True},
-                    "documentHighlight": {"dynamicRegistration": True},
-                    "documentSymbol": {
-                        "dynamicRegistration": True,
-                        "symbolKind": {
-                            "valueSet": [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26]
-                        },
-                        "hierarchicalDocumentSymbolSupport": True,
-                        "tagSupport": {"valueSet": [1, 2]},
-                    },
-                    "codeAction": {
-                        "dynamicRegistration": True,
-                        "isPreferredSupport": True,
-                        "disabledSupport": True,
-                        "dataSupport": True,
-                        "codeActionLiteralSupport": {
-                            "codeActionKind": {
-                                "valueSet": [
-                                    "",
-                                    "quickfix",
-                                    "refactor",
-                                    "refactor.extract",
-                                    "refactor.inline",
-                                    "refactor.rewrite",
-                                    "source",
-                                    "source.organizeImports",
-                                    "source.fixAll",
-                                ]
-                            }
-                        },
-                        "resolveSupport": {"properties": ["edit"]},
-                    },
-                    "codeLens": {"dynamicRegistration": True},
-                    "formatting": {"dynamicRegistration": True},
-                    "rangeFormatting": {"dynamicRegistration": True},
-                    "onTypeFormatting": {"dynamicRegistration": True},
-                    "rename": {"dynamicRegistration": True, "prepareSupport": True},
-                    "foldingRange": {
-                        "dynamicRegistration": True,
-                        "rangeLimit": 5000,
-                        "lineFoldingOnly": True,
-                    },
-                    "selectionRange": {"dynamicRegistration": True},
-                    "publishDiagnostics": {
-                        "relatedInformation": True,
-                        "versionSupport": False,
-                        "tagSupport": {"valueSet": [1, 2]},
-                        "codeDescriptionSupport": True,
-                        "dataSupport": True,
-                    },
-                    "callHierarchy": {"dynamicRegistration": True},
-                    "semanticTokens": {
-                        "dynamicRegistration": True,
-                        "tokenTypes": [
-                            "namespace",
-                            "type",
-                            "class",
-                            "enum",
-                            "interface",
-                            "struct",
-                            "typeParameter",
-                            "parameter",
-                            "variable",
-                            "property",
-                            "enumMember",
-                            "event",
-                            "function",
-                            "method",
-                            "macro",
-                            "keyword",
-                            "modifier",
-                            "comment",
-                            "string",
-                            "number",
-                            "regexp",
-                            "operator",
-                        ],
-                        "tokenModifiers": [
-                            "declaration",
-                            "definition",
-                            "readonly",
-                            "static",
-                            "deprecated",
-                            "abstract",
-                            "async",
-                            "modification",
-                            "documentation",
-                            "defaultLibrary",
-                        ],
-                        "formats": ["relative"],
-                        "requests": {"range": True, "full": {"delta": True}},
-                    },
-                },
-                "window": {
-                    "workDoneProgress": True,
-                    "showMessage": {"messageActionItem": {"additionalPropertiesSupport": True}},
-                    "showDocument": {"support": True},
-                },
-                "general": {
-                    "regularExpressions": {"engine": "ECMAScript"},
-                    "markdown": {"parser": "marked", "version": "1.1.0"},
-                },
-            },
-            "workspaceFolders": [
-                {"uri": pathlib.Path(repository_absolute_path).as_uri(), "name": os.path.basename(repository_absolute_path)}
-            ],
+            "rootUri": root_uri,
+            "initializationOptions": _BASE_INIT_OPTIONS,
+            "capabilities": _BASE_CAPABILITIES,
+            "workspaceFolders": [{"uri": root_uri, "name": os.path.basename(repository_absolute_path)}],
         }
 
         return initialize_params
 
+    def _on_analysis_complete(self, reason: str) -> None:
+        """
+        Marks the initial workspace analysis as complete; only the first call has an effect.
+        """
+        if self.found_source_files:
+            return
+        self.logger.log(reason, logging.INFO)
+        self.found_source_files = True
+        self.analysis_complete.set()
+        self.completions_available.set()
+
+    def _wait_for_analysis(self) -> None:
+        """
+        Blocks until SourceKit-LSP has completed its initial workspace analysis, but no longer than until
+        `analysis_timeout` seconds after the initialization handshake.
+        Once the deadline has passed, requests proceed immediately; `analysis_complete` is still only set
+        once SourceKit-LSP actually reports completion.
+        """
+        if self.analysis_complete.is_set():
+            return
+        remaining = max(0.0, self._analysis_deadline - time.monotonic())
+        if remaining > 0:
+            self.logger.log("Waiting for SourceKit-LSP to complete initial workspace analysis...", logging.INFO)
+            if self.analysis_complete.wait(timeout=remaining):
+                return
+        if not self.completions_available.is_set():
+            self.logger.log(
+                f"SourceKit-LSP analysis not reported within {self.analysis_timeout}s of initialization, proceeding without waiting",
+                logging.WARNING,
+            )
+            # the base implementation of request_completions blocks until completions are available
+            self.completions_available.set()
+
+    @override
+    def _send_definition_request(self, definition_params: DefinitionParams) -> lsp_types.Definition | list[lsp_types.LocationLink] | None:
+        self._wait_for_analysis()
+        return super()._send_definition_request(definition_params)
+
+    @override
+    def _send_references_request(self, relative_file_path: str, line: int, column: int) -> list[lsp_types.Location] | None:
+        self._wait_for_analysis()
+        return super()._send_references_request(relative_file_path, line, column)
+
+    @override
+    def request_completions(
+        self, relative_file_path: str, line: int, column: int, allow_incomplete: bool = False
+    ) -> list[ls_types.CompletionItem]:
+        self._wait_for_analysis()
+        return super().request_completions(relative_file_path, line, column, allow_incomplete=allow_incomplete)
+
+    @override
+    def request_workspace_symbol(self, query: str) -> list[ls_types.UnifiedSymbolInformation] | None:
+        self._wait_for_analysis()
+        return super().request_workspace_symbol(query)
+
+    def _on_log_message(self, msg) -> None:
+        """
+        Monitor SourceKit-LSP's log messages to detect when initial analysis is complete.
+        """
+        message_text = msg.get("message", "")
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.log(f"LSP: window/logMessage: {message_text}", logging.INFO)
+        if self.analysis_complete.is_set():
+            return
+
+        # SourceKit-LSP may log various indexing completion messages
+        if _LOG_DONE_RE.search(message_text) is not None:
+            self._on_analysis_complete("SourceKit-LSP workspace analysis complete")
+
+    def _on_show_message(self, msg) -> None:
+        """
+        Handle window/showMessage notifications from SourceKit-LSP
+        """
+        message_text = msg.get("message", "")
+        message_type = msg.get("type", 1)  # 1=Error, 2=Warning, 3=Info, 4=Log
+
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.log(f"LSP: window/showMessage (type={message_type}): {message_text}", logging.INFO)
+        # errors and warnings do not announce completion
+        if self.analysis_complete.is_set() or message_type not in (3, 4):
+            return
+
+        # Look for Swift package resolution or build completion messages
+        if _SHOW_DONE_RE.search(message_text) is not None:
+            self._on_analysis_complete("SourceKit-LSP analysis detected via showMessage")
+
+    def _on_progress(self, params) -> None:
+        """
+        Handle $/progress notifications which may indicate build/indexing progress
+        """
+        if self.analysis_complete.is_set():
+            return
+        value = params.get("value", {})
+        # only the end of a progress sequence can signal completion
+        if value.get("kind") != "end":
+            return
+
+        message = value.get("message", "")
+        if _PROGRESS_DONE_RE.search(message) is not None:
+            self._on_analysis_complete(f"SourceKit-LSP progress end: {message}")
+
     def _start_server(self):
         """
-        Starts the SourceKit-LSP Language Server and waits for initial workspace analysis to complete.
+        Starts the SourceKit-LSP Language Server, returning as soon as the initialization handshake is complete.
 
-        This prevents zombie processes by ensuring SourceKit-LSP has finished its initial background
-        tasks before we consider the server ready.
+        SourceKit-LSP continues its initial workspace analysis (package resolution, background indexing)
+        after the handshake; requests which rely on the index (definition, references, completions, workspace symbols)
+        wait for that analysis to complete (see `_wait_for_analysis`), while all other requests are served immediately.
 
         Usage:
         ```
         async with lsp.start_server():
-            # LanguageServer has been initialized and workspace analysis is complete
+            # LanguageServer has been initialized
             await lsp.request_definition(...)
             await lsp.request_references(...)
             # Shutdown the LanguageServer on exit from scope
         # LanguageServer has been shutdown cleanly
         ```
         """
-
-        def execute_client_command_handler(params):
-            return []
-
-        def do_nothing(params):
-            return
-
-        def window_log_message(msg):
-            """
-            Monitor SourceKit-LSP's log messages to detect when initial analysis is complete.
-            """
-            message_text = msg.get("message", "")
-            self.logger.log(f"LSP: window/logMessage: {message_text}", logging.INFO)
-
-            # SourceKit-LSP may log various indexing completion messages
-            if any(
-                keyword in message_text.lower()
-                for keyword in [
-                    "indexing complete",
-                    "finished indexing",
-                    "build complete",
-                    "compilation finished",
-                    "swift package resolved",
-                ]
-            ):
-                self.logger.log("SourceKit-LSP workspace analysis complete", logging.INFO)
-                self.found_source_files = True
-                self.analysis_complete.set()
-                self.completions_available.set()
-
-        def window_show_message(msg):
-            """
-            Handle window/showMessage notifications from SourceKit-LSP
-            """
-            message_text = msg.get("message", "")
-            message_type = msg.get("type", 1)  # 1=Error, 2=Warning, 3=Info, 4=Log
-
-            self.logger.log(f"LSP: window/showMessage (type={message_type}): {message_text}", logging.INFO)
-
-            # Look for Swift package resolution or build completion messages
-            if any(keyword in message_text.lower() for keyword in ["package resolution complete", "build succeeded", "indexing finished"]):
-                self.logger.log("SourceKit-LSP analysis detected via showMessage", logging.INFO)
-                if not self.found_source_files:
-                    self.found_source_files = True
-                    self.analysis_complete.set()
-                    self.completions_available.set()
-
-        def progress_notification(params):
-            """
-            Handle $/progress notifications which may indicate build/indexing progress
-            """
-            value = params.get("value", {})
-            kind = value.get("kind", "")
-            message = value.get("message", "")
-
-            if kind == "end" and any(keyword in message.lower() for keyword in ["indexing", "building", "resolving"]):
-                self.logger.log(f"SourceKit-LSP progress end: {message}", logging.INFO)
-                if not self.found_source_files:
-                    self.found_source_files = True
-                    self.analysis_complete.set()
-                    self.completions_available.set()
-
-        def workspace_configuration_handler(params):
-            """
-            Handle workspace/configuration requests from SourceKit-LSP
-            """
-            # Return empty configuration for now
-            return [{}] * len(params.get("items", []))
-
         # Set up notification handlers
-        self.server.on_request("client/registerCapability", do_nothing)
-        self.server.on_notification("window/logMessage", window_log_message)
-        self.server.on_notification("window/showMessage", window_show_message)
-        self.server.on_request("workspace/executeClientCommand", execute_client_command_handler)
-        self.server.on_request("workspace/configuration", workspace_configuration_handler)
-        self.server.on_notification("$/progress", progress_notification)
-        self.server.on_notification("textDocument/publishDiagnostics", do_nothing)
+        self.server.on_request("client/registerCapability", _do_nothing)
+        self.server.on_notification("window/logMessage", self._on_log_message)
+        self.server.on_notification("window/showMessage", self._on_show_message)
+        self.server.on_request("workspace/executeClientCommand", _empty_client_command)
+        self.server.on_request("workspace/configuration", _workspace_configuration)
+        self.server.on_notification("$/progress", self._on_progress)
+        self.server.on_notification("textDocument/publishDiagnostics", _do_nothing)
 
         self.logger.log("Starting sourcekit-lsp server process", logging.INFO)
         self.server.start()
@@ -349,17 +409,4 @@ class SwiftLanguageServer(SolidLanguageServer):
 
         # Complete the initialization handshake
         self.server.notify.initialized({})
-
-        # Wait for SourceKit-LSP to complete its initial workspace analysis
-        # This prevents zombie processes by ensuring background tasks finish
-        self.logger.log("Waiting for SourceKit-LSP to complete initial workspace analysis...", logging.INFO)
-
-        # SourceKit-LSP might take longer to analyze Swift packages, so increase timeout
-        timeout = 15.0
-        if self.analysis_complete.wait(timeout=timeout):
-            self.logger.log("SourceKit-LSP initial analysis complete, server ready", logging.INFO)
-        else:
-            self.logger.log(f"Timeout ({timeout}s) waiting for SourceKit-LSP analysis completion, proceeding anyway", logging.WARNING)
-            # Fallback: assume analysis is complete after timeout
-            self.analysis_complete.set()
-            self.completions_available.set()
+        self._analysis_deadline = time.monotonic() + self.analysis_timeout
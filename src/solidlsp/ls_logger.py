@@ -32,10 +32,19 @@ class LanguageServerLogger:
         self.logger.setLevel(log_level)
         self.json_format = json_format
 
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Returns whether messages of the given level would actually be logged
+        """
+        return self.logger.isEnabledFor(level)
+
     def log(self, debug_message: str, level: int, sanitized_error_message: str = "", stacklevel: int = 2) -> None:
         """
         Log the debug and sanitized messages using the logger
         """
+        if not self.logger.isEnabledFor(level):
+            return
+
         debug_message = debug_message.replace("'", '"').replace("\n", " ")
         sanitized_error_message = sanitized_error_message.replace("'", '"').replace("\n", " ")
 
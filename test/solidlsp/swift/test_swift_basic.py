@@ -0,0 +1,114 @@
+"""
+Tests for the Swift language server helpers which do not require a running sourcekit-lsp.
+"""
+
+import threading
+import time
+
+import pytest
+
+from solidlsp import SolidLanguageServer
+from solidlsp.language_servers.swift_language_server.swift_language_server import (
+    SwiftLanguageServer,
+    _workspace_configuration,
+)
+from solidlsp.ls_config import Language
+from test.conftest import create_default_ls
+
+
+@pytest.fixture(scope="module")
+def swift_ls() -> SolidLanguageServer:
+    """A Swift language server instance which is not started."""
+    return create_default_ls(Language.SWIFT)
+
+
+@pytest.fixture
+def fresh_swift_ls() -> SwiftLanguageServer:
+    """A new, not started Swift language server instance, for tests which modify the analysis state."""
+    ls = create_default_ls(Language.SWIFT)
+    assert isinstance(ls, SwiftLanguageServer)
+    return ls
+
+
+class TestSwiftIgnoredDirnames:
+    @pytest.mark.parametrize("dirname", ["MyApp.xcodeproj", "Foo.xcworkspace", ".build", "DerivedData"])
+    def test_build_and_xcode_dirs_are_ignored(self, swift_ls: SolidLanguageServer, dirname: str) -> None:
+        assert swift_ls.is_ignored_dirname(dirname)
+
+    def test_source_dir_is_not_ignored(self, swift_ls: SolidLanguageServer) -> None:
+        assert not swift_ls.is_ignored_dirname("Sources")
+
+
+class TestSwiftWorkspaceConfiguration:
+    def test_returns_distinct_dict_per_item(self) -> None:
+        result = _workspace_configuration({"items": [1, 2]})
+        assert result == [{}, {}]
+        assert result[0] is not result[1]
+
+    def test_no_items(self) -> None:
+        assert _workspace_configuration({}) == []
+
+
+class TestSwiftAnalysisCompletionMessages:
+    @pytest.mark.parametrize("message", ["Indexing Complete", "indexing complete", "Finished indexing", "Swift package resolved"])
+    def test_log_message_signals_completion(self, fresh_swift_ls: SwiftLanguageServer, message: str) -> None:
+        fresh_swift_ls._on_log_message({"type": 4, "message": message})
+        assert fresh_swift_ls.analysis_complete.is_set()
+
+    @pytest.mark.parametrize("message", ["Build succeeded", "Package resolution complete", "INDEXING FINISHED"])
+    def test_show_message_signals_completion(self, fresh_swift_ls: SwiftLanguageServer, message: str) -> None:
+        fresh_swift_ls._on_show_message({"type": 3, "message": message})
+        assert fresh_swift_ls.analysis_complete.is_set()
+
+    def test_progress_end_signals_completion_case_insensitively(self, fresh_swift_ls: SwiftLanguageServer) -> None:
+        fresh_swift_ls._on_progress({"token": "t", "value": {"kind": "end", "message": "Indexing"}})
+        assert fresh_swift_ls.analysis_complete.is_set()
+
+    def test_unrelated_messages_do_not_signal_completion(self, fresh_swift_ls: SwiftLanguageServer) -> None:
+        fresh_swift_ls._on_log_message({"type": 4, "message": "Opened document Person.swift"})
+        fresh_swift_ls._on_show_message({"type": 3, "message": "Build failed"})
+        assert not fresh_swift_ls.analysis_complete.is_set()
+
+
+class TestSwiftWaitForAnalysis:
+    def test_returns_immediately_after_deadline(self, fresh_swift_ls: SwiftLanguageServer) -> None:
+        fresh_swift_ls._analysis_deadline = time.monotonic() - 1.0
+        start = time.monotonic()
+        fresh_swift_ls._wait_for_analysis()
+        assert time.monotonic() - start < 1.0
+        assert fresh_swift_ls.completions_available.is_set()
+        assert not fresh_swift_ls.analysis_complete.is_set()
+
+    def test_waiting_caller_is_released_by_completion_message(self, fresh_swift_ls: SwiftLanguageServer) -> None:
+        fresh_swift_ls._analysis_deadline = time.monotonic() + 30.0
+        waiter = threading.Thread(target=fresh_swift_ls._wait_for_analysis, daemon=True)
+        waiter.start()
+        time.sleep(0.1)
+        assert waiter.is_alive(), "caller should wait while the analysis is incomplete and the deadline has not passed"
+
+        notifier = threading.Thread(target=fresh_swift_ls._on_log_message, args=({"message": "Indexing Complete"},))
+        notifier.start()
+        notifier.join(timeout=5.0)
+        waiter.join(timeout=5.0)
+        assert not waiter.is_alive()
+        assert fresh_swift_ls.analysis_complete.is_set()
+
+
+class TestSwiftNotificationFilters:
+    def test_show_message_errors_are_ignored(self, fresh_swift_ls: SwiftLanguageServer) -> None:
+        fresh_swift_ls._on_show_message({"type": 1, "message": "Build succeeded"})
+        assert not fresh_swift_ls.analysis_complete.is_set()
+
+    def test_progress_report_is_ignored(self, fresh_swift_ls: SwiftLanguageServer) -> None:
+        fresh_swift_ls._on_progress({"token": "t", "value": {"kind": "report", "message": "indexing"}})
+        assert not fresh_swift_ls.analysis_complete.is_set()
+
+    def test_progress_end_signals_completion(self, fresh_swift_ls: SwiftLanguageServer) -> None:
+        fresh_swift_ls._on_progress({"token": "t", "value": {"kind": "end", "message": "indexing"}})
+        assert fresh_swift_ls.analysis_complete.is_set()
+
+    def test_messages_after_completion_are_not_rescanned(self, fresh_swift_ls: SwiftLanguageServer) -> None:
+        fresh_swift_ls._on_progress({"token": "t", "value": {"kind": "end", "message": "indexing"}})
+        fresh_swift_ls.found_source_files = False  # would be set again if the message were scanned
+        fresh_swift_ls._on_log_message({"message": "indexing complete"})
+        assert not fresh_swift_ls.found_source_files